@@ -3,31 +3,57 @@
 
 import json
 import asyncio
+import functools
+import operator
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
-import requests
+
+# Imported lazily in initialize(); requests alone pulls urllib3,
+# charset_normalizer and certifi (~40ms) that ConfigLoader-only or
+# unreachable-API callers never need
+requests = None
+HTTPAdapter = None
+Retry = None
 
 try:
-    import asyncpg
-    ASYNCPG_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    ASYNCPG_AVAILABLE = False
+    HTTPX_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 from .config import ConfigLoader, get_config
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Individual test result."""
     test_type: str
     test_name: str
     passed: bool
     message: str = ""
-    details: Dict[str, Any] = field(default_factory=dict)
+    # None (not {}) so results without details never allocate a dict
+    details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NeonTestResults:
     """Aggregated Neon test results."""
     passed: int = 0
@@ -36,17 +62,68 @@ class NeonTestResults:
     warnings: int = 0
     tests: List[TestResult] = field(default_factory=list)
 
+    def to_json_records(self) -> List[Dict[str, Any]]:
+        """JSON-ready dicts for every record."""
+        return [
+            {"type": t.test_type, "name": t.test_name, "passed": t.passed,
+             "message": t.message, "details": t.details or {}}
+            for t in self.tests
+        ]
+
+
+# C-level multi-key fetch for the keys the Neon API guarantees on
+# every project record; optional keys keep using .get
+_get_id_name = operator.itemgetter("id", "name")
+
+
+@functools.lru_cache(maxsize=256)
+def _getaddrinfo_cached(host: str):
+    """Resolve a host once per process.
+
+    getaddrinfo (unlike the legacy gethostbyname) covers IPv6, and the
+    cache dedupes repeat resolutions of the same Neon hosts across
+    branches, projects and tester instances.
+    """
+    return socket.getaddrinfo(host, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+
 
 class NeonTester:
     """Neon PostgreSQL testing class."""
 
     API_BASE = "https://console.neon.tech/api/v2"
 
-    def __init__(self, config: Optional[ConfigLoader] = None):
+    # Successful GET responses are reused for this long (seconds) so
+    # repeated run_all calls (watcher modes) skip identical round trips
+    CACHE_TTL = 60
+
+    def __init__(self, config: Optional[ConfigLoader] = None, verbose: bool = True):
         self.config = config or get_config()
+        # verbose=False skips building per-test details entirely, for
+        # callers that only consume the pass/fail counters
+        self.verbose = verbose
         self.results = NeonTestResults()
         self.api_key = None
         self.session = None
+        self._auth_header = None
+        self._lock = threading.Lock()
+        self._pending_dns: List[tuple] = []
+        self._dns_cache: Dict[str, Any] = {}
+        self._response_cache: Dict[tuple, tuple] = {}
+
+    def _record(self, bucket: str, **kw):
+        """Append a TestResult and bump the given counter atomically.
+
+        bucket is one of "passed"/"failed"/"skipped"/"warnings".
+        """
+        if not self.verbose:
+            kw["details"] = None
+        with self._lock:
+            self.results.tests.append(TestResult(**kw))
+            setattr(self.results, bucket, getattr(self.results, bucket) + 1)
+
+    def is_configured(self) -> bool:
+        """Cheap check for a Neon API key, with no client imports."""
+        return bool(self.config.get_api_config("neon").secrets.get("api_key"))
 
     def initialize(self) -> bool:
         """Initialize Neon API client."""
@@ -54,22 +131,48 @@ class NeonTester:
         self.api_key = neon_config.secrets.get("api_key")
 
         if not self.api_key:
-            self.results.tests.append(TestResult(
+            self._record(
+                "skipped",
                 test_type="Neon",
                 test_name="API Key",
                 passed=False,
                 message="NEON_API_KEY not configured"
-            ))
-            self.results.skipped += 1
+            )
             return False
 
+        global requests, HTTPAdapter, Retry
+        if requests is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+        # Encode the bearer value once; every request reuses the same
+        # string instead of re-formatting it
+        self._auth_header = f"Bearer {self.api_key}"
+
         self.session = requests.Session()
+        # Keep the header set minimal - requests merges session headers
+        # into every call, and the Neon API tolerates missing
+        # Accept/Content-Type on the GETs we issue
         self.session.headers.update({
-            "Authorization": f"Bearer {self.api_key}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
+            "Authorization": self._auth_header,
+            "Connection": "keep-alive"
         })
 
+        # Larger pool than the requests default (10) so concurrent
+        # project tests keep their connections alive, plus retries on
+        # transient errors instead of burning the full 30s timeout
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504]
+            )
+        )
+        self.session.mount("https://", adapter)
+
         return True
 
     def run_all(self) -> NeonTestResults:
@@ -83,91 +186,230 @@ class NeonTester:
         # Test projects
         projects = self.test_list_projects()
 
-        # Test each project
+        # Test each project concurrently - each project is ~4 network
+        # round trips, so the work is I/O-bound and overlaps cleanly
         if projects:
-            for project in projects[:5]:  # Limit to 5 projects
-                self.test_project(project)
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                list(executor.map(self.test_project, projects[:5]))  # Limit to 5 projects
+
+        self._flush_pending_dns()
 
         return self.results
 
-    def _api_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict]:
-        """Make API request to Neon."""
-        url = f"{self.API_BASE}{endpoint}"
+    async def run_all_async(self) -> NeonTestResults:
+        """Run all Neon tests on one event loop via httpx.
+
+        HTTP/2 multiplexing lets the branch/endpoint/operation queries
+        for each project share a single connection, so a project costs
+        roughly one round trip instead of four.
+        """
+        if not HTTPX_AVAILABLE:
+            return self.run_all()
+
+        if not self.initialize():
+            return self.results
+
+        headers = {"Authorization": self._auth_header}
+        try:
+            client = httpx.AsyncClient(
+                base_url=self.API_BASE, headers=headers, http2=True, timeout=30
+            )
+        except ImportError:
+            # http2 extra (h2) not installed - fall back to HTTP/1.1
+            client = httpx.AsyncClient(
+                base_url=self.API_BASE, headers=headers, timeout=30
+            )
+
+        async with client:
+            # Test API authentication
+            self.test_api_auth(await self._api_request_async(
+                client, "GET", "/projects?limit=1"))
+
+            # Test projects
+            projects = self.test_list_projects(await self._api_request_async(
+                client, "GET", "/projects"))
+
+            # Test each project - all requests in flight at once
+            if projects:
+                await asyncio.gather(*(
+                    self._test_project_async(client, project)
+                    for project in projects[:5]  # Limit to 5 projects
+                ))
+
+        self._flush_pending_dns()
+
+        return self.results
+
+    async def _test_project_async(self, client, project: Dict):
+        """Fetch all endpoints for one project concurrently, then record."""
+        project_id = project["id"]
+        detail, branches, endpoints, operations = await asyncio.gather(
+            self._api_request_async(client, "GET", f"/projects/{project_id}"),
+            self._api_request_async(client, "GET", f"/projects/{project_id}/branches"),
+            self._api_request_async(client, "GET", f"/projects/{project_id}/endpoints"),
+            self._api_request_async(client, "GET", f"/projects/{project_id}/operations?limit=10"),
+        )
+        self.test_project(project, prefetched={
+            "project": detail,
+            "branches": branches,
+            "endpoints": endpoints,
+            "operations": operations
+        })
+
+    def _cache_key(self, method: str, endpoint: str, kwargs: Dict) -> Optional[tuple]:
+        """Cache key for a request, or None if not cacheable (non-GET)."""
+        if method != "GET":
+            return None
+        params = kwargs.get("params")
+        return (endpoint, tuple(sorted(params.items())) if params else None)
+
+    def _cache_get(self, key: Optional[tuple]) -> Optional[Dict]:
+        if key is None:
+            return None
+        cached = self._response_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+        return None
+
+    def _cache_put(self, key: Optional[tuple], result: Optional[Dict]):
+        # Only cache clean results; errors should be retried next run
+        if key is not None and result and "error" not in result:
+            with self._lock:
+                self._response_cache[key] = (time.monotonic(), result)
+
+    async def _api_request_async(self, client, method: str, endpoint: str,
+                                 **kwargs) -> Optional[Dict]:
+        """Make API request to Neon via httpx."""
+        key = self._cache_key(method, endpoint, kwargs)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         try:
-            response = self.session.request(method, url, timeout=30, **kwargs)
+            response = await client.request(method, endpoint, **kwargs)
             response.raise_for_status()
-            return response.json()
+            result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+            self._cache_put(key, result)
+            return result
+        except httpx.HTTPStatusError as e:
+            return {"error": str(e), "status": e.response.status_code}
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    def _api_request(self, method: str, endpoint: str,
+                     stream_path: Optional[str] = None, **kwargs) -> Optional[Dict]:
+        """Make API request to Neon.
+
+        stream_path names a top-level array ("projects", "branches", ...)
+        to stream-parse with ijson instead of materializing the whole
+        response tree; the result keeps the usual {stream_path: [...]}
+        shape so callers are unaffected.
+        """
+        key = self._cache_key(method, endpoint, kwargs)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        url = f"{self.API_BASE}{endpoint}"
+        try:
+            if stream_path and IJSON_AVAILABLE:
+                response = self.session.request(method, url, timeout=30,
+                                                stream=True, **kwargs)
+                response.raise_for_status()
+                # urllib3 leaves the stream undecoded under stream=True;
+                # without this ijson would choke on a gzipped response
+                response.raw.decode_content = True
+                try:
+                    result = {stream_path: list(ijson.items(
+                        response.raw, f"{stream_path}.item"))}
+                except ijson.JSONError as e:
+                    return {"error": str(e)}
+            else:
+                response = self.session.request(method, url, timeout=30, **kwargs)
+                response.raise_for_status()
+                result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+            self._cache_put(key, result)
+            return result
         except requests.exceptions.HTTPError as e:
             return {"error": str(e), "status": response.status_code}
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
 
-    def test_api_auth(self):
+    def test_api_auth(self, result: Optional[Dict] = None):
         """Test API authentication."""
         # Use /projects endpoint to test auth (no dedicated auth endpoint)
-        result = self._api_request("GET", "/projects?limit=1")
+        if result is None:
+            result = self._api_request("GET", "/projects?limit=1")
 
         if result and "error" not in result:
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="Neon API",
                 test_name="Authentication",
                 passed=True,
                 message="API authentication successful"
-            ))
-            self.results.passed += 1
+            )
             return True
         else:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="Neon API",
                 test_name="Authentication",
                 passed=False,
                 message=result.get("error", "Authentication failed")
-            ))
-            self.results.failed += 1
+            )
             return False
 
-    def test_list_projects(self) -> List[Dict]:
+    def test_list_projects(self, result: Optional[Dict] = None) -> List[Dict]:
         """Test listing projects."""
-        result = self._api_request("GET", "/projects")
+        if result is None:
+            result = self._api_request("GET", "/projects", stream_path="projects")
 
         if result and "error" not in result:
             projects = result.get("projects", [])
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="Neon API",
                 test_name="List Projects",
                 passed=True,
                 message=f"Found {len(projects)} projects",
                 details={
                     "count": len(projects),
-                    "projects": [{"id": p["id"], "name": p["name"]} for p in projects]
-                }
-            ))
-            self.results.passed += 1
+                    # Tuples: one allocation each, and orjson takes the
+                    # same array fast path as lists when serializing
+                    "projects": tuple(map(_get_id_name, projects))
+                } if self.verbose else None
+            )
             return projects
         else:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="Neon API",
                 test_name="List Projects",
                 passed=False,
                 message=result.get("error", "Failed to list projects")
-            ))
-            self.results.failed += 1
+            )
             return []
 
-    def test_project(self, project: Dict):
-        """Test a specific project."""
-        project_id = project["id"]
-        project_name = project["name"]
+    def test_project(self, project: Dict, prefetched: Optional[Dict[str, Any]] = None):
+        """Test a specific project.
+
+        prefetched optionally maps "project"/"branches"/"endpoints"/
+        "operations" to responses already fetched by the async path.
+        """
+        prefetched = prefetched or {}
+        project_id, project_name = _get_id_name(project)
 
         # Get project details
-        result = self._api_request("GET", f"/projects/{project_id}")
+        result = prefetched.get("project")
+        if result is None:
+            result = self._api_request("GET", f"/projects/{project_id}")
 
         if result and "error" not in result:
             proj_data = result.get("project", {})
             state = proj_data.get("state", "unknown")
             is_active = state in ("active", "idle")
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed" if is_active else "warnings",
                 test_type="Neon Project",
                 test_name=f"Project: {project_name}",
                 passed=is_active,
@@ -178,39 +420,38 @@ class NeonTester:
                     "region": proj_data.get("region_id"),
                     "created": proj_data.get("created_at")
                 }
-            ))
-            if is_active:
-                self.results.passed += 1
-            else:
-                self.results.warnings += 1
+            )
 
             # Test branches
-            self.test_branches(project_id, project_name)
+            self.test_branches(project_id, project_name, result=prefetched.get("branches"))
 
             # Test endpoints
-            self.test_endpoints(project_id, project_name)
+            self.test_endpoints(project_id, project_name, result=prefetched.get("endpoints"))
 
             # Test operations
-            self.test_operations(project_id, project_name)
+            self.test_operations(project_id, project_name, result=prefetched.get("operations"))
 
         else:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="Neon Project",
                 test_name=f"Project: {project_name}",
                 passed=False,
                 message=result.get("error", "Failed to get project details")
-            ))
-            self.results.failed += 1
+            )
 
-    def test_branches(self, project_id: str, project_name: str):
+    def test_branches(self, project_id: str, project_name: str, result: Optional[Dict] = None):
         """Test project branches."""
-        result = self._api_request("GET", f"/projects/{project_id}/branches")
+        if result is None:
+            result = self._api_request("GET", f"/projects/{project_id}/branches",
+                                       stream_path="branches")
 
         if result and "error" not in result:
             branches = result.get("branches", [])
             active_branches = [b for b in branches if b.get("current_state") in ("ready", "idle")]
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed" if active_branches else "warnings",
                 test_type="Neon Branches",
                 test_name=f"Branches: {project_name}",
                 passed=len(active_branches) > 0,
@@ -218,34 +459,33 @@ class NeonTester:
                 details={
                     "total": len(branches),
                     "active": len(active_branches),
-                    "branches": [
-                        {"name": b["name"], "state": b.get("current_state")}
+                    "branches": tuple(
+                        (b["name"], b.get("current_state"))
                         for b in branches
-                    ]
-                }
-            ))
-            if len(active_branches) > 0:
-                self.results.passed += 1
-            else:
-                self.results.warnings += 1
+                    )
+                } if self.verbose else None
+            )
         else:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="Neon Branches",
                 test_name=f"Branches: {project_name}",
                 passed=False,
                 message=result.get("error", "Failed to list branches")
-            ))
-            self.results.failed += 1
+            )
 
-    def test_endpoints(self, project_id: str, project_name: str):
+    def test_endpoints(self, project_id: str, project_name: str, result: Optional[Dict] = None):
         """Test project endpoints."""
-        result = self._api_request("GET", f"/projects/{project_id}/endpoints")
+        if result is None:
+            result = self._api_request("GET", f"/projects/{project_id}/endpoints",
+                                       stream_path="endpoints")
 
         if result and "error" not in result:
             endpoints = result.get("endpoints", [])
             active_endpoints = [e for e in endpoints if e.get("current_state") in ("active", "idle")]
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed" if active_endpoints else "warnings",
                 test_type="Neon Endpoints",
                 test_name=f"Endpoints: {project_name}",
                 passed=len(active_endpoints) > 0,
@@ -253,34 +493,54 @@ class NeonTester:
                 details={
                     "total": len(endpoints),
                     "active": len(active_endpoints),
-                    "endpoints": [
-                        {
-                            "id": e["id"],
-                            "host": e.get("host"),
-                            "state": e.get("current_state"),
-                            "type": e.get("type")
-                        }
+                    "endpoints": tuple(
+                        (e["id"], e.get("host"),
+                         e.get("current_state"), e.get("type"))
                         for e in endpoints
-                    ]
-                }
-            ))
-            if len(active_endpoints) > 0:
-                self.results.passed += 1
-            else:
-                self.results.warnings += 1
-
-            # Test connectivity to each endpoint
-            for endpoint in active_endpoints[:2]:  # Limit to 2
-                self.test_endpoint_connectivity(endpoint, project_name)
+                    )
+                } if self.verbose else None
+            )
+
+            # Queue connectivity checks; hosts are resolved in one
+            # concurrent batch after all projects finish
+            with self._lock:
+                self._pending_dns.extend(
+                    (endpoint, project_name)
+                    for endpoint in active_endpoints[:2]  # Limit to 2
+                )
 
         else:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="Neon Endpoints",
                 test_name=f"Endpoints: {project_name}",
                 passed=False,
                 message=result.get("error", "Failed to list endpoints")
-            ))
-            self.results.failed += 1
+            )
+
+    def _flush_pending_dns(self):
+        """Resolve queued endpoint hosts concurrently, then record results."""
+        if not self._pending_dns:
+            return
+
+        # Dedupe hosts shared across projects, then resolve in parallel
+        hosts = [h for h in {e.get("host") for e, _ in self._pending_dns} if h]
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for host, error in zip(hosts, executor.map(self._resolve_host, hosts)):
+                self._dns_cache[host] = error
+
+        for endpoint, project_name in self._pending_dns:
+            self.test_endpoint_connectivity(endpoint, project_name)
+        self._pending_dns = []
+
+    @staticmethod
+    def _resolve_host(host: str) -> Optional[Exception]:
+        """Resolve a host, returning the error (or None on success)."""
+        try:
+            _getaddrinfo_cached(host)
+            return None
+        except socket.gaierror as e:
+            return e
 
     def test_endpoint_connectivity(self, endpoint: Dict, project_name: str):
         """Test connectivity to a specific endpoint."""
@@ -291,35 +551,42 @@ class NeonTester:
             return
 
         # We can't actually connect without credentials, but we can check DNS
-        import socket
-        try:
-            socket.gethostbyname(host)
-            self.results.tests.append(TestResult(
+        if host in self._dns_cache:
+            error = self._dns_cache[host]
+        else:
+            error = self._resolve_host(host)
+            self._dns_cache[host] = error
+
+        if error is None:
+            self._record(
+                "passed",
                 test_type="Neon Connectivity",
                 test_name=f"DNS: {host[:30]}...",
                 passed=True,
                 message="Host resolves successfully",
                 details={"host": host, "endpoint_id": endpoint_id}
-            ))
-            self.results.passed += 1
-        except socket.gaierror as e:
-            self.results.tests.append(TestResult(
+            )
+        else:
+            self._record(
+                "failed",
                 test_type="Neon Connectivity",
                 test_name=f"DNS: {host[:30]}...",
                 passed=False,
-                message=f"DNS resolution failed: {e}"
-            ))
-            self.results.failed += 1
+                message=f"DNS resolution failed: {error}"
+            )
 
-    def test_operations(self, project_id: str, project_name: str):
+    def test_operations(self, project_id: str, project_name: str, result: Optional[Dict] = None):
         """Test recent operations on project."""
-        result = self._api_request("GET", f"/projects/{project_id}/operations?limit=10")
+        if result is None:
+            result = self._api_request("GET", f"/projects/{project_id}/operations?limit=10",
+                                       stream_path="operations")
 
         if result and "error" not in result:
             operations = result.get("operations", [])
             failed_ops = [o for o in operations if o.get("status") == "error"]
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "warnings" if failed_ops else "passed",
                 test_type="Neon Operations",
                 test_name=f"Recent Ops: {project_name}",
                 passed=len(failed_ops) == 0,
@@ -327,33 +594,63 @@ class NeonTester:
                 details={
                     "total": len(operations),
                     "failed": len(failed_ops),
-                    "recent": [
-                        {
-                            "action": o.get("action"),
-                            "status": o.get("status"),
-                            "created": o.get("created_at")
-                        }
+                    "recent": tuple(
+                        (o.get("action"), o.get("status"), o.get("created_at"))
                         for o in operations[:5]
-                    ]
-                }
-            ))
-            if len(failed_ops) == 0:
-                self.results.passed += 1
-            else:
-                self.results.warnings += 1
+                    )
+                } if self.verbose else None
+            )
         else:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="Neon Operations",
                 test_name=f"Recent Ops: {project_name}",
                 passed=False,
                 message=result.get("error", "Failed to list operations")
-            ))
-            self.results.failed += 1
+            )
+
+
+# Connection pools keyed by (event loop, DSN); repeat tests against
+# the same database on the same loop reuse an established connection
+# instead of paying TLS + startup again. A pool is bound to the loop
+# that created it, so a DSN-only key would hand a later asyncio.run a
+# pool attached to a dead loop.
+_pools: Dict[tuple, Any] = {}
+
+
+async def _get_pool(connection_string: str):
+    """Get (or lazily create) this loop's shared pool for a DSN."""
+    import asyncpg
+
+    key = (asyncio.get_running_loop(), connection_string)
+    pool = _pools.get(key)
+    if pool is None:
+        # statement_cache_size=0: we only ever run SELECT version(),
+        # so skip the prepared-statement round trip
+        pool = await asyncpg.create_pool(
+            connection_string, min_size=1, max_size=4,
+            statement_cache_size=0, timeout=10
+        )
+        _pools[key] = pool
+    return pool
+
+
+async def close_pools():
+    """Close the running loop's pools.
+
+    Call before the loop shuts down so connections are terminated
+    cleanly instead of at garbage collection after the loop is gone.
+    """
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _pools if k[0] is loop]:
+        await _pools.pop(key).close()
 
 
 async def test_database_connection(connection_string: str) -> TestResult:
     """Test actual database connection (requires asyncpg)."""
-    if not ASYNCPG_AVAILABLE:
+    try:
+        import asyncpg  # noqa: F401 - probe availability before pooling
+    except ImportError:
         return TestResult(
             test_type="Neon Connection",
             test_name="Database Connection",
@@ -362,11 +659,10 @@ async def test_database_connection(connection_string: str) -> TestResult:
         )
 
     try:
-        conn = await asyncpg.connect(connection_string, timeout=10)
-
-        # Test simple query
-        result = await conn.fetchval("SELECT version()")
-        await conn.close()
+        pool = await _get_pool(connection_string)
+        async with pool.acquire() as conn:
+            # Test simple query
+            result = await conn.fetchval("SELECT version()")
 
         return TestResult(
             test_type="Neon Connection",
@@ -384,6 +680,26 @@ async def test_database_connection(connection_string: str) -> TestResult:
         )
 
 
+def _write_json_results(results: NeonTestResults, out=None):
+    """Stream results to out as JSON, one record at a time.
+
+    Avoids materializing the full list-of-dicts plus its serialized
+    string; each record is encoded and written as it is visited.
+    """
+    if out is None:
+        out = sys.stdout.buffer
+    dumps = orjson.dumps if ORJSON_AVAILABLE else (lambda o: json.dumps(o).encode())
+
+    out.write(b'{"passed": %d, "failed": %d, "skipped": %d, "warnings": %d, "tests": ['
+              % (results.passed, results.failed, results.skipped, results.warnings))
+    for i, record in enumerate(results.to_json_records()):
+        if i:
+            out.write(b",")
+        out.write(dumps(record))
+    out.write(b"]}\n")
+    out.flush()
+
+
 def main():
     """Run Neon tests from command line."""
     import argparse
@@ -394,35 +710,45 @@ def main():
     args = parser.parse_args()
 
     tester = NeonTester()
-    results = tester.run_all()
-
-    # Test specific connection if provided
-    if args.connection:
-        conn_result = asyncio.run(test_database_connection(args.connection))
-        results.tests.append(conn_result)
-        if conn_result.passed:
-            results.passed += 1
-        else:
-            results.failed += 1
+
+    async def _run_async():
+        try:
+            results = await tester.run_all_async()
+            # Test specific connection on the same loop if provided
+            if args.connection:
+                conn_result = await test_database_connection(args.connection)
+                results.tests.append(conn_result)
+                if conn_result.passed:
+                    results.passed += 1
+                else:
+                    results.failed += 1
+            return results
+        finally:
+            await close_pools()
+
+    if HTTPX_AVAILABLE:
+        results = asyncio.run(_run_async())
+    else:
+        results = tester.run_all()
+
+        # Test specific connection if provided
+        if args.connection:
+
+            async def _test_connection():
+                try:
+                    return await test_database_connection(args.connection)
+                finally:
+                    await close_pools()
+
+            conn_result = asyncio.run(_test_connection())
+            results.tests.append(conn_result)
+            if conn_result.passed:
+                results.passed += 1
+            else:
+                results.failed += 1
 
     if args.json:
-        output = {
-            "passed": results.passed,
-            "failed": results.failed,
-            "skipped": results.skipped,
-            "warnings": results.warnings,
-            "tests": [
-                {
-                    "type": t.test_type,
-                    "name": t.test_name,
-                    "passed": t.passed,
-                    "message": t.message,
-                    "details": t.details
-                }
-                for t in results.tests
-            ]
-        }
-        print(json.dumps(output, indent=2))
+        _write_json_results(results)
     else:
         print(f"\nNeon Test Results:")
         print(f"  Passed: {results.passed}")
@@ -1,38 +1,148 @@
 #!/usr/bin/env python3
 """Oracle Cloud Infrastructure (OCI) testing module."""
 
+import asyncio
 import json
-from typing import Dict, Any, List, Optional
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# Imported lazily in initialize(); the OCI SDK pulls in a large module
+# graph that unconfigured or Neon-only runs never need
+oci = None
+
 try:
-    import oci
-    OCI_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    OCI_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 from .config import ConfigLoader, get_config
 
-
-@dataclass
+# Shared frozen mapping for detail-less results; one instance instead
+# of a fresh {} per record
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+# SDK config key -> our config key, driving the credential build in
+# initialize(); every mapped field except region is required
+_OCI_FIELD_MAP = (
+    ("tenancy", "tenancy_ocid"),
+    ("user", "user_ocid"),
+    ("fingerprint", "fingerprint"),
+    ("key_file", "private_key_path"),
+)
+_REQUIRED_FIELDS = ("tenancy", "user", "fingerprint", "key_file")
+
+# Indices into OciTestResults.counts
+PASSED, FAILED, SKIPPED, WARNINGS = range(4)
+_BUCKET_INDEX = {"passed": PASSED, "failed": FAILED,
+                 "skipped": SKIPPED, "warnings": WARNINGS}
+
+# ServiceError statuses worth retrying; anything else fails the
+# category immediately as before
+_RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Clients shared across OciTester instances: construction sets up
+# signers, TLS state and an HTTP connection pool, so repeat runs (CLI
+# invocations in one process, load-test harnesses) reuse them instead
+# of rebuilding. Keyed by class plus the identity fields of the config.
+_CLIENT_CACHE: Dict[tuple, Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Shared pool for per-resource detail RPCs (VNICs per instance, subnets
+# per VCN); sized above the category pool so inner fan-outs do not
+# starve each other. Module-level like _CLIENT_CACHE so successive
+# testers reuse the same threads instead of leaving 16 idle ones behind
+# per run.
+_IO_POOL = ThreadPoolExecutor(max_workers=16)
+
+
+@dataclass(slots=True)
 class TestResult:
     """Individual test result."""
     test_type: str
     test_name: str
     passed: bool
     message: str = ""
-    details: Dict[str, Any] = field(default_factory=dict)
+    # default_factory because dataclasses rejects the unhashable proxy
+    # as a plain default; the factory still hands out the one shared
+    # instance
+    details: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_DETAILS)
 
 
-@dataclass
+@dataclass(slots=True)
 class OciTestResults:
-    """Aggregated OCI test results."""
-    passed: int = 0
-    failed: int = 0
-    skipped: int = 0
-    warnings: int = 0
-    tests: List[TestResult] = field(default_factory=list)
+    """Aggregated OCI test results.
+
+    Records are stored struct-of-arrays: five parallel lists instead
+    of one TestResult object per record, so adding a result is plain
+    list appends with no per-record object construction. The tests
+    property materializes TestResult views for display paths.
+
+    Counters live in one list indexed by PASSED/FAILED/SKIPPED/
+    WARNINGS, so bumping one is a single indexed write; the named
+    properties remain for readers.
+    """
+    counts: List[int] = field(default_factory=lambda: [0, 0, 0, 0])
+    test_types: List[str] = field(default_factory=list)
+    test_names: List[str] = field(default_factory=list)
+    test_passed: List[bool] = field(default_factory=list)
+    test_messages: List[str] = field(default_factory=list)
+    test_details: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+
+    @property
+    def passed(self) -> int:
+        return self.counts[PASSED]
+
+    @property
+    def failed(self) -> int:
+        return self.counts[FAILED]
+
+    @property
+    def skipped(self) -> int:
+        return self.counts[SKIPPED]
+
+    @property
+    def warnings(self) -> int:
+        return self.counts[WARNINGS]
+
+    def add(self, test_type: str, test_name: str, passed: bool,
+            message: str = "", details: Optional[Dict[str, Any]] = None):
+        """Append one record across the parallel lists."""
+        self.test_types.append(test_type)
+        self.test_names.append(test_name)
+        self.test_passed.append(passed)
+        self.test_messages.append(message)
+        # Store None rather than an empty dict so detail-less records
+        # cost no allocation
+        self.test_details.append(details or None)
+
+    def to_json_records(self) -> List[Dict[str, Any]]:
+        """JSON-ready dicts for every record, zipped straight from the
+        parallel lists."""
+        return [
+            {"type": t, "name": n, "passed": p, "message": m,
+             "details": d or {}}
+            for t, n, p, m, d in zip(
+                self.test_types, self.test_names, self.test_passed,
+                self.test_messages, self.test_details)
+        ]
+
+    @property
+    def tests(self) -> List[TestResult]:
+        """Materialized TestResult views, for printing/inspection."""
+        return [
+            TestResult(t, n, p, m, d or _EMPTY_DETAILS)
+            for t, n, p, m, d in zip(
+                self.test_types, self.test_names, self.test_passed,
+                self.test_messages, self.test_details)
+        ]
 
 
 class OciTester:
@@ -43,106 +153,204 @@ class OciTester:
         self.results = OciTestResults()
         self.oci_config = None
         self.clients = {}
+        self._oci_api_config = None
+        self._lock = threading.Lock()
+        self._compartment_id = None
+        self._io_pool = _IO_POOL
+
+    def _cfg(self, key: str, default: Any = None) -> Any:
+        """Look up key in secrets, then extras, then fall back."""
+        cfg = self._oci_api_config
+        return cfg.secrets.get(key) or cfg.extra.get(key, default)
+
+    def _record(self, bucket: str, **kw):
+        """Append a TestResult and bump the given counter atomically.
+
+        bucket is one of "passed"/"failed"/"skipped"/"warnings".
+        """
+        with self._lock:
+            self.results.add(**kw)
+            self.results.counts[_BUCKET_INDEX[bucket]] += 1
+
+    def is_configured(self) -> bool:
+        """Cheap check for OCI credentials, with no SDK import."""
+        cfg = self.config.get_api_config("oracle_cloud")
+        return bool(cfg.secrets) or "tenancy_ocid" in cfg.extra
 
     def initialize(self) -> bool:
         """Initialize OCI SDK with configuration."""
-        if not OCI_AVAILABLE:
-            self.results.tests.append(TestResult(
-                test_type="OCI",
-                test_name="SDK Available",
-                passed=False,
-                message="OCI SDK not installed. Run: pip install oci"
-            ))
-            self.results.failed += 1
-            return False
+        global oci
+        if oci is None:
+            try:
+                import oci
+            except ImportError:
+                self._record(
+                    "failed",
+                    test_type="OCI",
+                    test_name="SDK Available",
+                    passed=False,
+                    message="OCI SDK not installed. Run: pip install oci"
+                )
+                return False
 
-        oci_api_config = self.config.get_api_config("oracle_cloud")
+        # Resolved once here; the per-category test methods previously
+        # re-fetched the API config and re-derived the compartment each
+        self._oci_api_config = self.config.get_api_config("oracle_cloud")
 
         try:
-            # Build OCI config from our config
-            self.oci_config = {
-                "tenancy": oci_api_config.secrets.get("tenancy_ocid") or
-                          oci_api_config.extra.get("tenancy_ocid"),
-                "user": oci_api_config.secrets.get("user_ocid") or
-                       oci_api_config.extra.get("user_ocid"),
-                "fingerprint": oci_api_config.secrets.get("fingerprint") or
-                              oci_api_config.extra.get("fingerprint"),
-                "key_file": oci_api_config.secrets.get("private_key_path") or
-                           oci_api_config.extra.get("private_key_path"),
-                "region": oci_api_config.extra.get("region", "us-ashburn-1"),
-            }
+            # Build OCI config from our config, driven by the field map
+            self.oci_config = {k: self._cfg(sk) for k, sk in _OCI_FIELD_MAP}
+            self.oci_config["region"] = self._oci_api_config.extra.get(
+                "region", "us-ashburn-1")
 
             # Check if we have all required fields
-            required_fields = ["tenancy", "user", "fingerprint", "key_file"]
-            missing_fields = [f for f in required_fields if not self.oci_config.get(f)]
+            missing_fields = [f for f in _REQUIRED_FIELDS
+                              if not self.oci_config[f]]
 
             if missing_fields:
-                self.results.tests.append(TestResult(
+                self._record(
+                    "skipped",
                     test_type="OCI",
                     test_name="Configuration",
                     passed=False,
                     message=f"Missing required fields: {missing_fields}"
-                ))
-                self.results.skipped += 1
+                )
                 return False
 
+            self._compartment_id = self._cfg(
+                "compartment_ocid", self.oci_config["tenancy"])
+
             # Validate config
             oci.config.validate_config(self.oci_config)
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="OCI",
                 test_name="Configuration Valid",
                 passed=True,
                 message="OCI configuration validated successfully"
-            ))
-            self.results.passed += 1
+            )
             return True
 
         except Exception as e:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="OCI",
                 test_name="Configuration",
                 passed=False,
                 message=str(e)
-            ))
-            self.results.failed += 1
+            )
             return False
 
     def run_all(self) -> OciTestResults:
         """Run all OCI tests."""
+        if not self.is_configured():
+            self._record(
+                "skipped",
+                test_type="OCI",
+                test_name="Configuration",
+                passed=False,
+                message="oracle_cloud credentials not configured"
+            )
+            return self.results
+
         if not self.initialize():
             return self.results
 
-        # Run test categories
-        self.test_identity()
-        self.test_compute()
-        self.test_networking()
-        self.test_database()
-        self.test_object_storage()
-        self.test_container_engine()
-        self.test_load_balancer()
+        # Run the independent service categories concurrently - each
+        # one is dominated by OCI API round trips, so the wall-clock
+        # cost becomes the slowest category instead of the sum
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(test)
+                           for test in self._categories()]:
+                future.result()
 
         return self.results
 
+    async def run_all_async(self) -> OciTestResults:
+        """Run all OCI tests from an event loop.
+
+        The OCI SDK is synchronous end to end, so each category runs
+        in a worker thread via asyncio.to_thread and the loop gathers
+        them; async callers overlap the sweep with their own I/O
+        without blocking, and results match run_all exactly.
+        """
+        if not self.is_configured():
+            return self.run_all()  # records the single skipped result
+
+        if not await asyncio.to_thread(self.initialize):
+            return self.results
+
+        await asyncio.gather(*(
+            asyncio.to_thread(test) for test in self._categories()
+        ))
+
+        return self.results
+
+    def _categories(self) -> tuple:
+        """The independent service category tests, in display order."""
+        return (
+            self.test_identity,
+            self.test_compute,
+            self.test_networking,
+            self.test_database,
+            self.test_object_storage,
+            self.test_container_engine,
+            self.test_load_balancer,
+        )
+
+    @staticmethod
+    def _call(fn, *args, **kwargs):
+        """Invoke an OCI API call, retrying transient failures.
+
+        429s and 5xx responses get up to two retries with jittered
+        exponential backoff instead of failing the whole category on
+        a blip; other ServiceErrors propagate immediately.
+        """
+        for attempt in range(3):
+            try:
+                return fn(*args, **kwargs)
+            except oci.exceptions.ServiceError as e:
+                if e.status not in _RETRYABLE_STATUSES or attempt == 2:
+                    raise
+                time.sleep(0.25 * 2 ** attempt + random.random() * 0.1)
+
+    def _list_all(self, list_fn, *args, **kwargs) -> List[Any]:
+        """Fetch every page of a paginated list call.
+
+        The raw list_X calls return only the first page and silently
+        truncate larger tenancies; the SDK's pagination helper follows
+        opc-next-page until exhausted.
+        """
+        return self._call(oci.pagination.list_call_get_all_results,
+                          list_fn, *args, **kwargs).data
+
     def _get_client(self, client_class: type, name: str):
         """Get or create an OCI client."""
         if name not in self.clients:
+            key = (client_class, self.oci_config["tenancy"],
+                   self.oci_config["user"], self.oci_config["fingerprint"])
             try:
-                self.clients[name] = client_class(self.oci_config)
+                with _CLIENT_CACHE_LOCK:
+                    client = _CLIENT_CACHE.get(key)
+                    if client is None:
+                        client = client_class(self.oci_config)
+                        _CLIENT_CACHE[key] = client
+                self.clients[name] = client
             except Exception as e:
-                self.results.tests.append(TestResult(
+                self._record(
+                    "failed",
                     test_type="OCI",
                     test_name=f"Client: {name}",
                     passed=False,
                     message=str(e)
-                ))
-                self.results.failed += 1
+                )
                 return None
         return self.clients[name]
 
     def test_identity(self):
         """Test OCI Identity service."""
-        if not OCI_AVAILABLE:
+        if oci is None:
             return
 
         identity = self._get_client(oci.identity.IdentityClient, "identity")
@@ -152,62 +360,69 @@ class OciTester:
         try:
             # Get compartments
             compartment_id = self.oci_config.get("tenancy")
-            compartments = identity.list_compartments(
+            compartments = self._list_all(
+                identity.list_compartments,
                 compartment_id,
                 compartment_id_in_subtree=True
-            ).data
+            )
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="OCI Identity",
                 test_name="List Compartments",
                 passed=True,
                 message=f"Found {len(compartments)} compartments",
                 details={"count": len(compartments)}
-            ))
-            self.results.passed += 1
+            )
 
             # Get users
-            users = identity.list_users(compartment_id).data
-            self.results.tests.append(TestResult(
+            users = self._list_all(identity.list_users, compartment_id)
+            self._record(
+                "passed",
                 test_type="OCI Identity",
                 test_name="List Users",
                 passed=True,
                 message=f"Found {len(users)} users",
                 details={"count": len(users)}
-            ))
-            self.results.passed += 1
+            )
 
         except oci.exceptions.ServiceError as e:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="OCI Identity",
                 test_name="Identity Tests",
                 passed=False,
                 message=f"Service error: {e.message}"
-            ))
-            self.results.failed += 1
+            )
 
     def test_compute(self):
         """Test OCI Compute service."""
-        if not OCI_AVAILABLE:
+        if oci is None:
             return
 
         compute = self._get_client(oci.core.ComputeClient, "compute")
         if not compute:
             return
 
-        oci_api_config = self.config.get_api_config("oracle_cloud")
-        compartment_id = oci_api_config.secrets.get("compartment_ocid") or \
-                        oci_api_config.extra.get("compartment_ocid") or \
-                        self.oci_config.get("tenancy")
+        compartment_id = self._compartment_id
 
         try:
             # List instances
-            instances = compute.list_instances(compartment_id).data
-
-            running_instances = [i for i in instances if i.lifecycle_state == "RUNNING"]
-            stopped_instances = [i for i in instances if i.lifecycle_state == "STOPPED"]
-
-            self.results.tests.append(TestResult(
+            instances = self._list_all(compute.list_instances, compartment_id)
+
+            # Single pass: collect running instances and count stopped
+            # ones together instead of scanning the list per state
+            running_instances = []
+            stopped_count = 0
+            for i in instances:
+                state = i.lifecycle_state
+                if state == "RUNNING":
+                    running_instances.append(i)
+                elif state == "STOPPED":
+                    stopped_count += 1
+
+            self._record(
+                "passed",
                 test_type="OCI Compute",
                 test_name="List Instances",
                 passed=True,
@@ -215,20 +430,25 @@ class OciTester:
                 details={
                     "total": len(instances),
                     "running": len(running_instances),
-                    "stopped": len(stopped_instances)
+                    "stopped": stopped_count
                 }
-            ))
-            self.results.passed += 1
-
-            # Check instance health
-            for instance in running_instances[:5]:  # Check first 5
+            )
+
+            # Check instance health - the per-instance VNIC queries are
+            # independent RPCs, so issue them all at once on the shared
+            # pool; concurrency replaces the old first-5 truncation
+            vnic_futures = [
+                (instance, self._io_pool.submit(
+                    self._list_all, compute.list_vnic_attachments,
+                    compartment_id, instance_id=instance.id))
+                for instance in running_instances
+            ]
+            for instance, future in vnic_futures:
                 try:
-                    vnic_attachments = compute.list_vnic_attachments(
-                        compartment_id,
-                        instance_id=instance.id
-                    ).data
+                    vnic_attachments = future.result()
 
-                    self.results.tests.append(TestResult(
+                    self._record(
+                        "passed",
                         test_type="OCI Compute",
                         test_name=f"Instance: {instance.display_name}",
                         passed=True,
@@ -238,39 +458,37 @@ class OciTester:
                             "shape": instance.shape,
                             "vnics": len(vnic_attachments)
                         }
-                    ))
-                    self.results.passed += 1
-                except Exception as e:
-                    self.results.warnings += 1
+                    )
+                except Exception:
+                    with self._lock:
+                        self.results.counts[WARNINGS] += 1
 
         except oci.exceptions.ServiceError as e:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="OCI Compute",
                 test_name="Compute Tests",
                 passed=False,
                 message=f"Service error: {e.message}"
-            ))
-            self.results.failed += 1
+            )
 
     def test_networking(self):
         """Test OCI Networking service."""
-        if not OCI_AVAILABLE:
+        if oci is None:
             return
 
         network = self._get_client(oci.core.VirtualNetworkClient, "network")
         if not network:
             return
 
-        oci_api_config = self.config.get_api_config("oracle_cloud")
-        compartment_id = oci_api_config.secrets.get("compartment_ocid") or \
-                        oci_api_config.extra.get("compartment_ocid") or \
-                        self.oci_config.get("tenancy")
+        compartment_id = self._compartment_id
 
         try:
             # List VCNs
-            vcns = network.list_vcns(compartment_id).data
+            vcns = self._list_all(network.list_vcns, compartment_id)
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="OCI Networking",
                 test_name="List VCNs",
                 passed=True,
@@ -279,69 +497,70 @@ class OciTester:
                     "count": len(vcns),
                     "vcns": [{"name": v.display_name, "state": v.lifecycle_state} for v in vcns]
                 }
-            ))
-            self.results.passed += 1
-
-            # Check each VCN
-            for vcn in vcns[:3]:  # Check first 3
-                subnets = network.list_subnets(compartment_id, vcn_id=vcn.id).data
+            )
+
+            # Check each VCN; subnet queries fan out on the shared pool
+            subnet_futures = [
+                (vcn, self._io_pool.submit(
+                    self._list_all, network.list_subnets,
+                    compartment_id, vcn_id=vcn.id))
+                for vcn in vcns
+            ]
+            for vcn, future in subnet_futures:
+                subnets = future.result()
 
-                self.results.tests.append(TestResult(
+                is_available = vcn.lifecycle_state == "AVAILABLE"
+                self._record(
+                    "passed" if is_available else "warnings",
                     test_type="OCI Networking",
                     test_name=f"VCN: {vcn.display_name}",
-                    passed=vcn.lifecycle_state == "AVAILABLE",
+                    passed=is_available,
                     message=f"VCN has {len(subnets)} subnets",
                     details={
                         "id": vcn.id,
                         "state": vcn.lifecycle_state,
                         "subnets": len(subnets)
                     }
-                ))
-                if vcn.lifecycle_state == "AVAILABLE":
-                    self.results.passed += 1
-                else:
-                    self.results.warnings += 1
+                )
 
         except oci.exceptions.ServiceError as e:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="OCI Networking",
                 test_name="Networking Tests",
                 passed=False,
                 message=f"Service error: {e.message}"
-            ))
-            self.results.failed += 1
+            )
 
     def test_database(self):
         """Test OCI Database service."""
-        if not OCI_AVAILABLE:
+        if oci is None:
             return
 
         db = self._get_client(oci.database.DatabaseClient, "database")
         if not db:
             return
 
-        oci_api_config = self.config.get_api_config("oracle_cloud")
-        compartment_id = oci_api_config.secrets.get("compartment_ocid") or \
-                        oci_api_config.extra.get("compartment_ocid") or \
-                        self.oci_config.get("tenancy")
+        compartment_id = self._compartment_id
 
         try:
             # List Autonomous Databases
-            adbs = db.list_autonomous_databases(compartment_id).data
+            adbs = self._list_all(db.list_autonomous_databases, compartment_id)
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="OCI Database",
                 test_name="List Autonomous Databases",
                 passed=True,
                 message=f"Found {len(adbs)} autonomous databases",
                 details={"count": len(adbs)}
-            ))
-            self.results.passed += 1
+            )
 
             # Check each ADB
-            for adb in adbs[:3]:
+            for adb in adbs:
                 is_available = adb.lifecycle_state == "AVAILABLE"
-                self.results.tests.append(TestResult(
+                self._record(
+                    "passed" if is_available else "warnings",
                     test_type="OCI Database",
                     test_name=f"ADB: {adb.display_name}",
                     passed=is_available,
@@ -351,60 +570,56 @@ class OciTester:
                         "state": adb.lifecycle_state,
                         "db_version": adb.db_version
                     }
-                ))
-                if is_available:
-                    self.results.passed += 1
-                else:
-                    self.results.warnings += 1
+                )
 
         except oci.exceptions.ServiceError as e:
             if e.status == 404:
-                self.results.tests.append(TestResult(
+                self._record(
+                    "passed",
                     test_type="OCI Database",
                     test_name="Database Tests",
                     passed=True,
                     message="No databases configured"
-                ))
-                self.results.passed += 1
+                )
             else:
-                self.results.tests.append(TestResult(
+                self._record(
+                    "failed",
                     test_type="OCI Database",
                     test_name="Database Tests",
                     passed=False,
                     message=f"Service error: {e.message}"
-                ))
-                self.results.failed += 1
+                )
 
     def test_object_storage(self):
         """Test OCI Object Storage service."""
-        if not OCI_AVAILABLE:
+        if oci is None:
             return
 
         os_client = self._get_client(oci.object_storage.ObjectStorageClient, "object_storage")
         if not os_client:
             return
 
-        oci_api_config = self.config.get_api_config("oracle_cloud")
-        compartment_id = oci_api_config.secrets.get("compartment_ocid") or \
-                        oci_api_config.extra.get("compartment_ocid") or \
-                        self.oci_config.get("tenancy")
+        compartment_id = self._compartment_id
 
         try:
             # Get namespace
-            namespace = os_client.get_namespace(compartment_id=compartment_id).data
+            namespace = self._call(os_client.get_namespace,
+                                   compartment_id=compartment_id).data
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="OCI Object Storage",
                 test_name="Get Namespace",
                 passed=True,
                 message=f"Namespace: {namespace}"
-            ))
-            self.results.passed += 1
+            )
 
             # List buckets
-            buckets = os_client.list_buckets(namespace, compartment_id).data
+            buckets = self._list_all(os_client.list_buckets,
+                                     namespace, compartment_id)
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="OCI Object Storage",
                 test_name="List Buckets",
                 passed=True,
@@ -413,49 +628,46 @@ class OciTester:
                     "count": len(buckets),
                     "buckets": [b.name for b in buckets]
                 }
-            ))
-            self.results.passed += 1
+            )
 
         except oci.exceptions.ServiceError as e:
-            self.results.tests.append(TestResult(
+            self._record(
+                "failed",
                 test_type="OCI Object Storage",
                 test_name="Object Storage Tests",
                 passed=False,
                 message=f"Service error: {e.message}"
-            ))
-            self.results.failed += 1
+            )
 
     def test_container_engine(self):
         """Test OCI Container Engine for Kubernetes (OKE)."""
-        if not OCI_AVAILABLE:
+        if oci is None:
             return
 
         ce = self._get_client(oci.container_engine.ContainerEngineClient, "container_engine")
         if not ce:
             return
 
-        oci_api_config = self.config.get_api_config("oracle_cloud")
-        compartment_id = oci_api_config.secrets.get("compartment_ocid") or \
-                        oci_api_config.extra.get("compartment_ocid") or \
-                        self.oci_config.get("tenancy")
+        compartment_id = self._compartment_id
 
         try:
             # List clusters
-            clusters = ce.list_clusters(compartment_id).data
+            clusters = self._list_all(ce.list_clusters, compartment_id)
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="OCI Container Engine",
                 test_name="List Clusters",
                 passed=True,
                 message=f"Found {len(clusters)} OKE clusters",
                 details={"count": len(clusters)}
-            ))
-            self.results.passed += 1
+            )
 
             # Check each cluster
             for cluster in clusters:
                 is_active = cluster.lifecycle_state == "ACTIVE"
-                self.results.tests.append(TestResult(
+                self._record(
+                    "passed" if is_active else "warnings",
                     test_type="OCI Container Engine",
                     test_name=f"Cluster: {cluster.name}",
                     passed=is_active,
@@ -465,56 +677,49 @@ class OciTester:
                         "state": cluster.lifecycle_state,
                         "kubernetes_version": cluster.kubernetes_version
                     }
-                ))
-                if is_active:
-                    self.results.passed += 1
-                else:
-                    self.results.warnings += 1
+                )
 
         except oci.exceptions.ServiceError as e:
             if e.status == 404:
-                self.results.tests.append(TestResult(
+                self._record(
+                    "passed",
                     test_type="OCI Container Engine",
                     test_name="Container Engine Tests",
                     passed=True,
                     message="No OKE clusters configured"
-                ))
-                self.results.passed += 1
+                )
             else:
-                self.results.tests.append(TestResult(
+                self._record(
+                    "failed",
                     test_type="OCI Container Engine",
                     test_name="Container Engine Tests",
                     passed=False,
                     message=f"Service error: {e.message}"
-                ))
-                self.results.failed += 1
+                )
 
     def test_load_balancer(self):
         """Test OCI Load Balancer service."""
-        if not OCI_AVAILABLE:
+        if oci is None:
             return
 
         lb = self._get_client(oci.load_balancer.LoadBalancerClient, "load_balancer")
         if not lb:
             return
 
-        oci_api_config = self.config.get_api_config("oracle_cloud")
-        compartment_id = oci_api_config.secrets.get("compartment_ocid") or \
-                        oci_api_config.extra.get("compartment_ocid") or \
-                        self.oci_config.get("tenancy")
+        compartment_id = self._compartment_id
 
         try:
             # List load balancers
-            lbs = lb.list_load_balancers(compartment_id).data
+            lbs = self._list_all(lb.list_load_balancers, compartment_id)
 
-            self.results.tests.append(TestResult(
+            self._record(
+                "passed",
                 test_type="OCI Load Balancer",
                 test_name="List Load Balancers",
                 passed=True,
                 message=f"Found {len(lbs)} load balancers",
                 details={"count": len(lbs)}
-            ))
-            self.results.passed += 1
+            )
 
             # Check each LB
             for load_balancer in lbs:
@@ -523,7 +728,8 @@ class OciTester:
                 # Get backend health
                 backend_sets = list(load_balancer.backend_sets.keys()) if load_balancer.backend_sets else []
 
-                self.results.tests.append(TestResult(
+                self._record(
+                    "passed" if is_active else "warnings",
                     test_type="OCI Load Balancer",
                     test_name=f"LB: {load_balancer.display_name}",
                     passed=is_active,
@@ -534,29 +740,25 @@ class OciTester:
                         "backend_sets": backend_sets,
                         "ip_addresses": [ip.ip_address for ip in load_balancer.ip_addresses] if load_balancer.ip_addresses else []
                     }
-                ))
-                if is_active:
-                    self.results.passed += 1
-                else:
-                    self.results.warnings += 1
+                )
 
         except oci.exceptions.ServiceError as e:
             if e.status == 404:
-                self.results.tests.append(TestResult(
+                self._record(
+                    "passed",
                     test_type="OCI Load Balancer",
                     test_name="Load Balancer Tests",
                     passed=True,
                     message="No load balancers configured"
-                ))
-                self.results.passed += 1
+                )
             else:
-                self.results.tests.append(TestResult(
+                self._record(
+                    "failed",
                     test_type="OCI Load Balancer",
                     test_name="Load Balancer Tests",
                     passed=False,
                     message=f"Service error: {e.message}"
-                ))
-                self.results.failed += 1
+                )
 
 
 def main():
@@ -576,18 +778,13 @@ def main():
             "failed": results.failed,
             "skipped": results.skipped,
             "warnings": results.warnings,
-            "tests": [
-                {
-                    "type": t.test_type,
-                    "name": t.test_name,
-                    "passed": t.passed,
-                    "message": t.message,
-                    "details": t.details
-                }
-                for t in results.tests
-            ]
+            "tests": results.to_json_records()
         }
-        print(json.dumps(output, indent=2))
+        if ORJSON_AVAILABLE:
+            sys.stdout.buffer.write(
+                orjson.dumps(output, option=orjson.OPT_INDENT_2) + b"\n")
+        else:
+            print(json.dumps(output, indent=2))
     else:
         print(f"\nOCI Test Results:")
         print(f"  Passed: {results.passed}")
@@ -2,117 +2,180 @@
 """Main test runner for AfterDark Validation Kit - Python tests."""
 
 import argparse
+import contextlib
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 from dataclasses import asdict
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import print as rprint
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .config import get_config, ConfigLoader
-from .oci_tester import OciTester
-from .neon_tester import NeonTester
 
+# Status cells are constant - build the markup once, not per row
+_PASS = "[green]PASS[/]"
+_FAIL = "[red]FAIL[/]"
 
-console = Console()
+# Rich pulls in a large module graph; it is imported on first pretty
+# output so plain runs (the default) never pay the startup cost
+_console = None
+
+
+def get_console():
+    """Shared Console, created on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 class ValidationRunner:
     """Main validation test runner."""
 
-    def __init__(self, config_path: str = None):
+    # Rich cell measurement is O(rows x cols); past this many rows the
+    # pretty table summarizes instead of rendering every record
+    MAX_PRETTY_ROWS = 50
+
+    def __init__(self, config_path: str = None, pretty: bool = False):
+        # pretty enables Rich tables/panels/spinner; the default is
+        # plain line output, which is far cheaper for large runs
+        self.pretty = pretty
         if config_path:
             self.config = ConfigLoader(config_path)
             self.config.load()
         else:
             self.config = get_config()
 
+        # One formatted tag per run: strftime walks the locale tables,
+        # so repeated save_results calls reuse this instead
+        self._run_tag = datetime.now().strftime("%Y%m%d-%H%M%S")
         self.results = {
             "timestamp": datetime.now().isoformat(),
             "summary": {"passed": 0, "failed": 0, "skipped": 0, "warnings": 0},
             "tests": {}
         }
+        # Raw suite result objects; JSON projections are streamed from
+        # these at save time instead of being materialized up front
+        self._suites: Dict[str, Any] = {}
+        # Serializes Rich output and summary updates when the OCI and
+        # Neon suites run on separate threads
+        self._print_lock = threading.Lock()
 
     def run_all(self, verbose: bool = False) -> Dict[str, Any]:
-        """Run all tests."""
-        with console.status("[bold blue]Running validation tests..."):
-            self.run_oci_tests(verbose)
-            self.run_neon_tests(verbose)
+        """Run all tests.
+
+        The OCI and Neon suites hit different providers and share no
+        state, so they run on two threads; wall-clock time is the
+        slower suite rather than the sum of both.
+        """
+        status = (get_console().status("[bold blue]Running validation tests...")
+                  if self.pretty else contextlib.nullcontext())
+        with status:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                for future in [executor.submit(self.run_oci_tests, verbose),
+                               executor.submit(self.run_neon_tests, verbose)]:
+                    future.result()
 
         return self.results
 
     def run_oci_tests(self, verbose: bool = False) -> Dict[str, Any]:
         """Run Oracle Cloud Infrastructure tests."""
-        console.print("\n[bold cyan]Running OCI Tests...[/]")
+        self._print_heading("Running OCI Tests...")
+
+        # Imported here so a --neon-only run never loads the OCI SDK
+        from .oci_tester import OciTester
 
         tester = OciTester(self.config)
         results = tester.run_all()
 
+        self._suites["oci"] = results
         self.results["tests"]["oci"] = {
             "passed": results.passed,
             "failed": results.failed,
             "skipped": results.skipped,
-            "warnings": results.warnings,
-            "tests": [
-                {
-                    "type": t.test_type,
-                    "name": t.test_name,
-                    "passed": t.passed,
-                    "message": t.message,
-                    "details": t.details
-                }
-                for t in results.tests
-            ]
+            "warnings": results.warnings
         }
 
         self._update_summary(results)
-        self._print_results("OCI", results, verbose)
+        with self._print_lock:
+            self._print_results("OCI", results, verbose)
 
         return self.results["tests"]["oci"]
 
     def run_neon_tests(self, verbose: bool = False) -> Dict[str, Any]:
         """Run Neon database tests."""
-        console.print("\n[bold cyan]Running Neon Tests...[/]")
+        self._print_heading("Running Neon Tests...")
+
+        from .neon_tester import NeonTester
 
         tester = NeonTester(self.config)
         results = tester.run_all()
 
+        self._suites["neon"] = results
         self.results["tests"]["neon"] = {
             "passed": results.passed,
             "failed": results.failed,
             "skipped": results.skipped,
-            "warnings": results.warnings,
-            "tests": [
-                {
-                    "type": t.test_type,
-                    "name": t.test_name,
-                    "passed": t.passed,
-                    "message": t.message,
-                    "details": t.details
-                }
-                for t in results.tests
-            ]
+            "warnings": results.warnings
         }
 
         self._update_summary(results)
-        self._print_results("Neon", results, verbose)
+        with self._print_lock:
+            self._print_results("Neon", results, verbose)
 
         return self.results["tests"]["neon"]
 
     def _update_summary(self, results):
         """Update summary counts."""
-        self.results["summary"]["passed"] += results.passed
-        self.results["summary"]["failed"] += results.failed
-        self.results["summary"]["skipped"] += results.skipped
-        self.results["summary"]["warnings"] += results.warnings
+        with self._print_lock:
+            self._update_summary_locked(results)
+
+    def _update_summary_locked(self, results):
+        summary = self.results["summary"]
+        counts = getattr(results, "counts", None)
+        if counts is not None:
+            # OCI results keep their counters as an indexed list
+            for key, value in zip(("passed", "failed", "skipped", "warnings"),
+                                  counts):
+                summary[key] += value
+        else:
+            summary["passed"] += results.passed
+            summary["failed"] += results.failed
+            summary["skipped"] += results.skipped
+            summary["warnings"] += results.warnings
+
+    def _print_heading(self, text: str):
+        """Print a section heading in the active output style."""
+        if self.pretty:
+            get_console().print(f"\n[bold cyan]{text}[/]")
+        else:
+            sys.stdout.write(f"\n{text}\n")
 
     def _print_results(self, category: str, results, verbose: bool):
         """Print test results."""
+        if not self.pretty:
+            write = sys.stdout.write
+            for test in results.tests:
+                status = "PASS" if test.passed else "FAIL"
+                write(f"  [{status}] {test.test_type}: "
+                      f"{test.test_name} - {test.message}\n")
+            write(f"{category}: {results.passed} passed, "
+                  f"{results.failed} failed, {results.warnings} warnings, "
+                  f"{results.skipped} skipped\n")
+            return
+
+        from rich.table import Table
+        from rich.panel import Panel
+
         # Create status table
         table = Table(title=f"{category} Test Results")
         table.add_column("Type", style="cyan")
@@ -120,16 +183,22 @@ class ValidationRunner:
         table.add_column("Status", style="bold")
         table.add_column("Message", style="dim")
 
-        for test in results.tests:
-            status = "[green]PASS[/]" if test.passed else "[red]FAIL[/]"
+        tests = results.tests
+        for test in tests[:self.MAX_PRETTY_ROWS]:
+            msg = test.message
             table.add_row(
                 test.test_type,
                 test.test_name,
-                status,
-                test.message[:50] + "..." if len(test.message) > 50 else test.message
+                _PASS if test.passed else _FAIL,
+                msg if len(msg) <= 50 else msg[:47] + "..."
+            )
+        if len(tests) > self.MAX_PRETTY_ROWS:
+            table.add_row(
+                "...", f"{len(tests) - self.MAX_PRETTY_ROWS} more results",
+                "", "(run with --json for the full list)"
             )
 
-        console.print(table)
+        get_console().print(table)
 
         # Print summary
         summary = Panel(
@@ -139,12 +208,23 @@ class ValidationRunner:
             f"[blue]Skipped: {results.skipped}[/]",
             title=f"{category} Summary"
         )
-        console.print(summary)
+        get_console().print(summary)
 
     def print_final_summary(self):
         """Print final summary of all tests."""
         summary = self.results["summary"]
 
+        if not self.pretty:
+            sys.stdout.write(
+                f"\nFinal: {summary['passed']} passed, "
+                f"{summary['failed']} failed, "
+                f"{summary['warnings']} warnings, "
+                f"{summary['skipped']} skipped\n")
+            return
+
+        from rich.panel import Panel
+
+        console = get_console()
         console.print("\n")
         panel = Panel(
             f"[bold green]Passed: {summary['passed']}[/]\n"
@@ -156,18 +236,50 @@ class ValidationRunner:
         )
         console.print(panel)
 
+    def write_results(self, out):
+        """Stream the full results document to a binary file object.
+
+        Each test record is encoded and written as it is visited, so
+        peak memory stays flat no matter how many results a run
+        produced.
+        """
+        dumps = (orjson.dumps if ORJSON_AVAILABLE
+                 else lambda o: json.dumps(o, default=str).encode())
+
+        out.write(b'{"timestamp": ' + dumps(self.results["timestamp"]))
+        out.write(b', "summary": ' + dumps(self.results["summary"]))
+        out.write(b', "tests": {')
+        for i, (name, counters) in enumerate(self.results["tests"].items()):
+            if i:
+                out.write(b", ")
+            out.write(dumps(name) + b": ")
+            suite = self._suites.get(name)
+            if suite is None:
+                out.write(dumps(counters))
+                continue
+            out.write(dumps(counters)[:-1] + b', "tests": [')
+            for j, record in enumerate(suite.to_json_records()):
+                if j:
+                    out.write(b",")
+                out.write(dumps(record))
+            out.write(b"]}")
+        out.write(b"}}\n")
+        out.flush()
+
     def save_results(self, output_path: str = None):
         """Save results to JSON file."""
         if output_path is None:
             reports_dir = Path(__file__).parent.parent.parent / "reports"
             reports_dir.mkdir(exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            output_path = reports_dir / f"python-tests-{timestamp}.json"
+            output_path = reports_dir / f"python-tests-{self._run_tag}.json"
 
-        with open(output_path, "w") as f:
-            json.dump(self.results, f, indent=2, default=str)
+        with open(output_path, "wb") as f:
+            self.write_results(f)
 
-        console.print(f"\n[green]Results saved to: {output_path}[/]")
+        if self.pretty:
+            get_console().print(f"\n[green]Results saved to: {output_path}[/]")
+        else:
+            sys.stdout.write(f"\nResults saved to: {output_path}\n")
 
 
 def main():
@@ -203,6 +315,11 @@ def main():
         action="store_true",
         help="Output results as JSON"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Rich tables and spinner (plain output by default)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -212,13 +329,17 @@ def main():
     args = parser.parse_args()
 
     # Print header
-    console.print(Panel.fit(
-        "[bold blue]AfterDark Validation Kit[/]\n"
-        "[dim]Python Infrastructure Tests[/]",
-        border_style="blue"
-    ))
+    if args.pretty:
+        from rich.panel import Panel
+        get_console().print(Panel.fit(
+            "[bold blue]AfterDark Validation Kit[/]\n"
+            "[dim]Python Infrastructure Tests[/]",
+            border_style="blue"
+        ))
+    else:
+        sys.stdout.write("AfterDark Validation Kit - Python Infrastructure Tests\n")
 
-    runner = ValidationRunner(args.config)
+    runner = ValidationRunner(args.config, pretty=args.pretty)
 
     try:
         if args.all or (not args.oci and not args.neon):
@@ -230,7 +351,7 @@ def main():
                 runner.run_neon_tests(args.verbose)
 
         if args.json:
-            print(json.dumps(runner.results, indent=2, default=str))
+            runner.write_results(sys.stdout.buffer)
         else:
             runner.print_final_summary()
             runner.save_results(args.output)
@@ -240,13 +361,13 @@ def main():
             sys.exit(1)
 
     except KeyboardInterrupt:
-        console.print("\n[yellow]Tests interrupted by user[/]")
+        sys.stderr.write("\nTests interrupted by user\n")
         sys.exit(130)
     except Exception as e:
-        console.print(f"\n[red]Error: {e}[/]")
+        sys.stderr.write(f"\nError: {e}\n")
         if args.verbose:
             import traceback
-            console.print(traceback.format_exc())
+            sys.stderr.write(traceback.format_exc())
         sys.exit(1)
 
 
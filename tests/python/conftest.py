@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the src/ packages importable without an install step
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
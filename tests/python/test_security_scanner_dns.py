@@ -0,0 +1,102 @@
+"""Regression tests for the scanner's DNS-caching HTTPS adapter.
+
+The adapter must speed up resolution without weakening TLS: the socket
+is dialled to the cached address, but SNI and certificate verification
+have to keep using the original hostname. An earlier version rewrote
+the connection's ``_dns_host`` (which urllib3 derives ``host`` from),
+silently failing certificate checks against the IP literal on every
+scan - these tests pin the correct behaviour against a local TLS
+server.
+"""
+
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+trustme = pytest.importorskip("trustme")
+
+from python.security_scanner import SecurityScanner, _getaddrinfo_cached
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b"<html><body>ok</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # keep pytest output clean
+        pass
+
+
+@pytest.fixture()
+def tls_server(tmp_path):
+    """Local HTTPS server with a certificate valid for 'localhost' only.
+
+    The hostname-only certificate is the point: if the adapter ever
+    verifies against the resolved IP instead of the hostname, requests
+    through it fail with SSLCertVerificationError.
+    """
+    ca = trustme.CA()
+    server_cert = ca.issue_cert("localhost")
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_cert.configure_cert(context)
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    ca_path = tmp_path / "ca.pem"
+    ca.cert_pem.write_to_path(str(ca_path))
+    try:
+        yield server.server_address[1], str(ca_path)
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def test_adapter_preserves_tls_verification(tls_server):
+    port, ca_path = tls_server
+    scanner = SecurityScanner()
+    _getaddrinfo_cached.cache_clear()
+
+    # Request-level verify so a REQUESTS_CA_BUNDLE in the environment
+    # cannot override the test CA
+    response = scanner.session.get(f"https://localhost:{port}/",
+                                   timeout=5, verify=ca_path)
+
+    assert response.status_code == 200
+    # The connection resolved through the scanner's cache, not the
+    # stock resolver
+    assert _getaddrinfo_cached.cache_info().currsize == 1
+
+
+def test_adapter_serves_repeat_lookups_from_cache(tls_server):
+    port, ca_path = tls_server
+    scanner = SecurityScanner()
+    _getaddrinfo_cached.cache_clear()
+
+    url = f"https://localhost:{port}/"
+    # Connection: close forces the second request onto a fresh socket,
+    # so it has to resolve again - and must hit the cache
+    scanner.session.get(url, timeout=5, verify=ca_path,
+                        headers={"Connection": "close"})
+    scanner.session.get(url, timeout=5, verify=ca_path)
+
+    assert _getaddrinfo_cached.cache_info().hits >= 1
+
+
+def test_bounded_get_through_adapter(tls_server):
+    port, ca_path = tls_server
+    scanner = SecurityScanner()
+
+    response, body = scanner._bounded_get(
+        f"https://localhost:{port}/", 1024, timeout=5, verify=ca_path)
+
+    assert response.status_code == 200
+    assert "ok" in body